@@ -441,7 +441,8 @@ async def ls(flow_name: List[str] = None, by_created: bool = False):
         }
 
     sort_by_name_keys = lambda d: (flows[d.flow_id].name, d.name)
-    sort_by_created_key = lambda d: pendulum.now("utc") - d.created
+    now = pendulum.now("utc")
+    sort_by_created_key = lambda d: now - d.created
 
     table = Table(
         title="Deployments",
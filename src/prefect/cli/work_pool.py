@@ -93,7 +93,8 @@ async def ls(
     async with get_client() as client:
         pools = await client.read_work_pools()
 
-    sort_by_created_key = lambda q: pendulum.now("utc") - q.created
+    now = pendulum.now("utc")
+    sort_by_created_key = lambda q: now - q.created
 
     for pool in sorted(pools, key=sort_by_created_key):
         row = [
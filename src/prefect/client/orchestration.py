@@ -1783,7 +1783,8 @@ class PrefectClient:
         Returns:
             The created task run.
         """
-        tags = set(task.tags).union(extra_tags or [])
+        tags = set(task.tags)
+        tags.update(extra_tags or [])
 
         if state is None:
             state = prefect.states.Pending()
@@ -490,7 +490,10 @@ class DockerContainer(Infrastructure):
             return None
 
         # Check for a local API connection
-        api_url = self.env.get("PREFECT_API_URL", PREFECT_API_URL.value())
+        if "PREFECT_API_URL" in self.env:
+            api_url = self.env["PREFECT_API_URL"]
+        else:
+            api_url = PREFECT_API_URL.value()
 
         if api_url:
             try:
@@ -129,15 +129,19 @@ class ResultFactory(pydantic.BaseModel):
         Keyword arguments may be provided to override defaults. Null keys will be
         ignored.
         """
-        # Remove any null keys so `setdefault` can do its magic
+        # Remove any null keys so defaults can be applied
         for key, value in tuple(kwargs.items()):
             if value is None:
                 kwargs.pop(key)
 
-        # Apply defaults
-        kwargs.setdefault("result_storage", get_default_result_storage())
-        kwargs.setdefault("result_serializer", get_default_result_serializer())
-        kwargs.setdefault("persist_result", get_default_persist_setting())
+        # Apply defaults; these are only generated when missing since creating the
+        # default storage block is wasted work when storage is provided
+        if "result_storage" not in kwargs:
+            kwargs["result_storage"] = get_default_result_storage()
+        if "result_serializer" not in kwargs:
+            kwargs["result_serializer"] = get_default_result_serializer()
+        if "persist_result" not in kwargs:
+            kwargs["persist_result"] = get_default_persist_setting()
         kwargs.setdefault("cache_result_in_memory", True)
         kwargs.setdefault("storage_key_fn", DEFAULT_STORAGE_KEY_FN)
 
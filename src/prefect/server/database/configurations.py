@@ -216,7 +216,7 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
                 kwargs.update(poolclass=sa.pool.SingletonThreadPool)
 
             engine = create_async_engine(self.connection_url, echo=self.echo, **kwargs)
-            sa.event.listen(engine.sync_engine, "engine_connect", self.setup_sqlite)
+            sa.event.listen(engine.sync_engine, "connect", self.setup_sqlite)
 
             self.ENGINES[cache_key] = engine
             await self.schedule_engine_disposal(cache_key)
@@ -246,32 +246,37 @@ class AioSqliteConfiguration(BaseDatabaseConfiguration):
 
         await add_event_loop_shutdown_callback(partial(dispose_engine, cache_key))
 
-    def setup_sqlite(self, conn, named=True):
+    def setup_sqlite(self, dbapi_connection, connection_record):
         """Issue PRAGMA statements to SQLITE on connect. PRAGMAs only last for the
         duration of the connection. See https://www.sqlite.org/pragma.html for more info.
+
+        This listens for the pool `connect` event so the statements are issued once
+        per database connection rather than every time a connection is checked out.
         """
+        cursor = dbapi_connection.cursor()
+
         # enable foreign keys
-        conn.execute(sa.text("PRAGMA foreign_keys = ON;"))
+        cursor.execute("PRAGMA foreign_keys = ON;")
 
         # write to a write-ahead-log instead and regularly
         # commit the changes
         # this allows multiple concurrent readers even during
         # a write transaction
-        conn.execute(sa.text("PRAGMA journal_mode = WAL;"))
+        cursor.execute("PRAGMA journal_mode = WAL;")
 
         # when using the WAL, we do need to sync changes on every write. sqlite
         # recommends using 'normal' mode which is much faster
-        conn.execute(sa.text("PRAGMA synchronous = NORMAL;"))
+        cursor.execute("PRAGMA synchronous = NORMAL;")
 
         # a higher cache size (default of 2000) for more aggressive performance
-        conn.execute(sa.text("PRAGMA cache_size = 20000;"))
+        cursor.execute("PRAGMA cache_size = 20000;")
 
         # wait for this amount of time while a table is locked
         # before returning and rasing an error
         # setting the value very high allows for more 'concurrency'
         # without running into errors, but may result in slow api calls
-        conn.execute(sa.text("PRAGMA busy_timeout = 60000;"))  # 60s
-        conn.commit()
+        cursor.execute("PRAGMA busy_timeout = 60000;")  # 60s
+        cursor.close()
 
     async def session(self, engine: AsyncEngine) -> AsyncSession:
         """
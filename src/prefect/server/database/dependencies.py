@@ -40,13 +40,17 @@ def provide_database_interface() -> PrefectDBInterface:
     If components of the interface are not set, defaults will be inferred
     based on the dialect of the connection URL.
     """
-    connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
-
     database_config = MODELS_DEPENDENCIES.get("database_config")
     query_components = MODELS_DEPENDENCIES.get("query_components")
     orm = MODELS_DEPENDENCIES.get("orm")
     interface_class = MODELS_DEPENDENCIES.get("interface_class")
-    dialect = get_dialect(connection_url)
+
+    # The connection URL is only needed to infer missing components; this is called
+    # whenever a database interface is injected so we avoid resolving the setting and
+    # parsing the URL once all of the components are set
+    if database_config is None or query_components is None or orm is None:
+        connection_url = PREFECT_API_DATABASE_CONNECTION_URL.value()
+        dialect = get_dialect(connection_url)
 
     if database_config is None:
         if dialect.name == "postgresql":
@@ -578,13 +578,15 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
     ):
         """Given a list of flow run ids and associated states, set the state_id
         to the appropriate state for all flow runs"""
+        state_ids = tuple(r["id"] for r in insert_flow_run_states)
+
         # postgres supports `UPDATE ... FROM` syntax
         stmt = (
             sa.update(fr_model)
             .where(
                 fr_model.id.in_(inserted_flow_run_ids),
                 frs_model.flow_run_id == fr_model.id,
-                frs_model.id.in_([r["id"] for r in insert_flow_run_states]),
+                frs_model.id.in_(state_ids),
             )
             .values(state_id=frs_model.id)
             # no need to synchronize as these flow runs are entirely new
@@ -757,12 +759,14 @@ class AioSqliteQueryComponents(BaseQueryComponents):
     ):
         """Given a list of flow run ids and associated states, set the state_id
         to the appropriate state for all flow runs"""
+        state_ids = tuple(r["id"] for r in insert_flow_run_states)
+
         # sqlite requires a correlated subquery to update from another table
         subquery = (
             sa.select(frs_model.id)
             .where(
                 frs_model.flow_run_id == fr_model.id,
-                frs_model.id.in_([r["id"] for r in insert_flow_run_states]),
+                frs_model.id.in_(state_ids),
             )
             .limit(1)
             .scalar_subquery()
@@ -133,17 +133,15 @@ async def read_latest_artifact(
     Returns:
         Artifact: The latest artifact
     """
-    latest_id_query = (
-        sa.select(db.ArtifactCollection.latest_id)
+    latest_artifact_query = (
+        sa.select(db.Artifact)
+        .join(
+            db.ArtifactCollection,
+            db.ArtifactCollection.latest_id == db.Artifact.id,
+        )
         .where(db.ArtifactCollection.key == key)
         .limit(1)
     )
-    latest_id = await session.execute(latest_id_query)
-    latest_id_scalar = latest_id.scalar()
-
-    latest_artifact_query = sa.select(db.Artifact).where(
-        db.Artifact.id == latest_id_scalar
-    )
     result = await session.execute(latest_artifact_query)
 
     return result.scalar()
@@ -628,11 +628,13 @@ async def _insert_scheduled_flow_runs(
     )
     inserted_flow_run_ids = (await session.execute(inserted_rows)).scalars().all()
 
-    # insert flow run states that correspond to the newly-insert rows
+    # insert flow run states that correspond to the newly-insert rows; a set is used
+    # for the membership check to avoid a quadratic scan over large batches
+    inserted_flow_run_id_set = set(inserted_flow_run_ids)
     insert_flow_run_states = [
         {"id": uuid4(), "flow_run_id": r["id"], **r["state"]}
         for r in runs
-        if r["id"] in inserted_flow_run_ids
+        if r["id"] in inserted_flow_run_id_set
     ]
     if insert_flow_run_states:
         # this syntax (insert statement, values to insert) is most efficient
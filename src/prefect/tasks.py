@@ -7,7 +7,6 @@ Module containing the base workflow task class and decorator - for most use case
 import datetime
 import inspect
 import warnings
-from copy import copy
 from functools import partial, update_wrapper
 from typing import (
     TYPE_CHECKING,
@@ -389,7 +388,8 @@ class Task(Generic[P, R]):
             fn=self.fn,
             name=name or self.name,
             description=description or self.description,
-            tags=tags or copy(self.tags),
+            # tags are copied into a new set on initialization
+            tags=tags or self.tags,
             cache_key_fn=cache_key_fn or self.cache_key_fn,
             cache_expiration=cache_expiration or self.cache_expiration,
             task_run_name=task_run_name,
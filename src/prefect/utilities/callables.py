@@ -2,6 +2,7 @@
 Utilities for working with Python callables.
 """
 import inspect
+import weakref
 from functools import partial
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
@@ -20,6 +21,30 @@ from prefect.exceptions import (
 )
 from prefect.logging.loggers import disable_logger
 
+# Signatures are cached per callable since `inspect.signature` is expensive and the
+# signature of a function does not change after definition. Weak references are used
+# so cached entries do not keep functions alive.
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_signature(fn: Callable) -> inspect.Signature:
+    """
+    Retrieve the signature of a callable, using a cached value when available.
+
+    Callables that cannot be weakly referenced or hashed are introspected on each call.
+    """
+    try:
+        return _SIGNATURE_CACHE[fn]
+    except KeyError:
+        signature = inspect.signature(fn)
+        _SIGNATURE_CACHE[fn] = signature
+        return signature
+    except TypeError:
+        # The callable does not support weak references or is not hashable
+        return inspect.signature(fn)
+
 
 def get_call_parameters(
     fn: Callable,
@@ -33,8 +58,19 @@ def get_call_parameters(
 
     Raises a ParameterBindError if the arguments/kwargs are not valid for the function
     """
+    signature = get_signature(fn)
+
+    # Calls with only keyword arguments are common and can usually be resolved
+    # without the cost of a full `Signature.bind`
+    if not call_args:
+        parameters = _get_keyword_only_call_parameters(
+            signature, call_kwargs, apply_defaults
+        )
+        if parameters is not None:
+            return parameters
+
     try:
-        bound_signature = inspect.signature(fn).bind(*call_args, **call_kwargs)
+        bound_signature = signature.bind(*call_args, **call_kwargs)
     except TypeError as exc:
         raise ParameterBindError.from_bind_failure(fn, exc, call_args, call_kwargs)
 
@@ -47,13 +83,49 @@ def get_call_parameters(
     return dict(bound_signature.arguments)
 
 
+def _get_keyword_only_call_parameters(
+    signature: inspect.Signature, call_kwargs: Dict[str, Any], apply_defaults: bool
+) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the parameter/value mapping for a call made with keyword arguments only,
+    ordered to match the signature as `Signature.bind` would.
+
+    Returns `None` if the call requires a full bind, e.g. when the signature has
+    variadic or positional-only parameters or the arguments are invalid.
+    """
+    parameters = {}
+    matched = 0
+
+    for name, parameter in signature.parameters.items():
+        if parameter.kind not in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            return None
+
+        if name in call_kwargs:
+            parameters[name] = call_kwargs[name]
+            matched += 1
+        elif parameter.default is parameter.empty:
+            # Missing a required argument
+            return None
+        elif apply_defaults:
+            parameters[name] = parameter.default
+
+    if matched != len(call_kwargs):
+        # Unexpected keyword arguments were given
+        return None
+
+    return parameters
+
+
 def get_parameter_defaults(
     fn: Callable,
 ) -> Dict[str, Any]:
     """
     Get default parameter values for a callable.
     """
-    signature = inspect.signature(fn)
+    signature = get_signature(fn)
 
     parameter_defaults = {}
 
@@ -83,7 +155,7 @@ def explode_variadic_parameter(
         ```
     """
     variadic_key = None
-    for key, parameter in inspect.signature(fn).parameters.items():
+    for key, parameter in get_signature(fn).parameters.items():
         if parameter.kind == parameter.VAR_KEYWORD:
             variadic_key = key
             break
@@ -116,7 +188,7 @@ def collapse_variadic_parameters(
         # {"a": 1, "b": 2, "kwargs": {"c": 3, "d": 4}}
         ```
     """
-    signature_parameters = inspect.signature(fn).parameters
+    signature_parameters = get_signature(fn).parameters
     variadic_key = None
     for key, parameter in signature_parameters.items():
         if parameter.kind == parameter.VAR_KEYWORD:
@@ -151,14 +223,15 @@ def parameters_to_args_kwargs(
     The function _must_ have an identical signature to the original function or this
     will return an empty tuple and dict.
     """
-    function_params = dict(inspect.signature(fn).parameters).keys()
+    signature = get_signature(fn)
+    function_params = dict(signature.parameters).keys()
     # Check for parameters that are not present in the function signature
     unknown_params = parameters.keys() - function_params
     if unknown_params:
         raise SignatureMismatchError.from_bad_params(
             list(function_params), list(parameters.keys())
         )
-    bound_signature = inspect.signature(fn).bind_partial()
+    bound_signature = signature.bind_partial()
     bound_signature.arguments = parameters
 
     return bound_signature.args, bound_signature.kwargs
@@ -263,7 +336,7 @@ def parameter_schema(fn: Callable) -> ParameterSchema:
     Returns:
         dict: the argument schema
     """
-    signature = inspect.signature(fn)
+    signature = get_signature(fn)
     model_fields = {}
     aliases = {}
     docstrings = parameter_docstrings(inspect.getdoc(fn))
@@ -311,7 +384,7 @@ def parameter_schema(fn: Callable) -> ParameterSchema:
 def raise_for_reserved_arguments(fn: Callable, reserved_arguments: Iterable[str]):
     """Raise a ReservedArgumentError if `fn` has any parameters that conflict
     with the names contained in `reserved_arguments`."""
-    function_paremeters = inspect.signature(fn).parameters
+    function_paremeters = get_signature(fn).parameters
 
     for argument in reserved_arguments:
         if argument in function_paremeters:
@@ -223,6 +223,23 @@ async def test_root_flow_custom_storage_by_instance_unsaved(orion_client, tmp_pa
     assert LocalFileSystem._from_block_document(storage_block_document) == storage
 
 
+def test_root_flow_custom_storage_does_not_create_default_storage(
+    tmp_path, monkeypatch
+):
+    def fail():
+        raise AssertionError("Default storage should not be created")
+
+    monkeypatch.setattr("prefect.results.get_default_result_storage", fail)
+    storage = LocalFileSystem(basepath=tmp_path)
+
+    @flow(result_storage=storage)
+    def foo():
+        return get_run_context().result_factory
+
+    result_factory = foo()
+    assert result_factory.storage_block == storage
+
+
 def test_child_flow_inherits_default_result_settings():
     @flow
     def foo():
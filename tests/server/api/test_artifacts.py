@@ -80,12 +80,14 @@ async def artifacts(flow_run, task_run, client):
     ]
 
 
-@pytest.fixture(autouse=True)
-def auto_enable_artifacts(enable_artifacts):
+@pytest.fixture(scope="module", autouse=True)
+def auto_enable_artifacts():
     """
-    Enable artifacts for testing
+    Enable artifacts once for every test in this module
     """
-    assert PREFECT_EXPERIMENTAL_ENABLE_ARTIFACTS.value() is True
+    with temporary_settings({PREFECT_EXPERIMENTAL_ENABLE_ARTIFACTS: True}):
+        assert PREFECT_EXPERIMENTAL_ENABLE_ARTIFACTS.value() is True
+        yield
 
 
 class TestEnableArtifactsFlag:
@@ -203,3 +203,19 @@ async def test_inject_interface_class():
     with dependencies.temporary_interface_class(TestInterface):
         db = dependencies.provide_database_interface()
         assert isinstance(db, TestInterface)
+
+
+async def test_provide_database_interface_does_not_resolve_url_when_components_set(
+    db, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError("The connection URL should not be parsed")
+
+    monkeypatch.setattr(dependencies, "get_dialect", fail)
+
+    with dependencies.temporary_database_interface(
+        tmp_database_config=db.database_config,
+        tmp_queries=db.queries,
+        tmp_orm_config=db.orm,
+    ):
+        assert dependencies.provide_database_interface() is db
@@ -1,4 +1,7 @@
 import datetime
+import gc
+import inspect
+import weakref
 from enum import Enum
 from typing import Any, Dict, List, Tuple, Union
 
@@ -507,3 +510,74 @@ class TestGetCallParameters:
 
         with pytest.raises(ParameterBindError):
             callables.get_call_parameters(dog, call_args=(), call_kwargs={"x": "y"})
+
+    def test_keyword_only_call_matches_signature_order(self):
+        def dog(x, y, z=3):
+            pass
+
+        parameters = callables.get_call_parameters(
+            dog, call_args=(), call_kwargs={"y": 2, "x": 1}
+        )
+        assert parameters == {"x": 1, "y": 2, "z": 3}
+        assert list(parameters) == ["x", "y", "z"]
+
+    def test_keyword_only_call_without_defaults(self):
+        def dog(x, *, y=2, z=3):
+            pass
+
+        parameters = callables.get_call_parameters(
+            dog, call_args=(), call_kwargs={"z": 4, "x": 1}, apply_defaults=False
+        )
+        assert list(parameters.items()) == [("x", 1), ("z", 4)]
+
+    def test_keyword_only_call_with_variadic_keyword_arguments(self):
+        def dog(x, **kwargs):
+            pass
+
+        parameters = callables.get_call_parameters(
+            dog, call_args=(), call_kwargs={"x": 1, "y": 2}
+        )
+        assert parameters == {"x": 1, "kwargs": {"y": 2}}
+
+    def test_mixed_call_matches_signature_order(self):
+        def dog(x, y, z=3):
+            pass
+
+        parameters = callables.get_call_parameters(
+            dog, call_args=(1,), call_kwargs={"z": 4, "y": 2}
+        )
+        assert list(parameters.items()) == [("x", 1), ("y", 2), ("z", 4)]
+
+
+class TestGetSignature:
+    def test_returns_signature(self):
+        def dog(x, y=1):
+            pass
+
+        assert callables.get_signature(dog) == inspect.signature(dog)
+
+    def test_caches_signature(self):
+        def dog(x):
+            pass
+
+        assert callables.get_signature(dog) is callables.get_signature(dog)
+
+    def test_does_not_keep_callable_alive(self):
+        def dog(x):
+            pass
+
+        callables.get_signature(dog)
+        ref = weakref.ref(dog)
+        del dog
+        gc.collect()
+
+        assert ref() is None
+
+    def test_supports_unhashable_callables(self):
+        class Dog:
+            __hash__ = None
+
+            def __call__(self, x):
+                pass
+
+        assert callables.get_signature(Dog()) == inspect.signature(Dog())